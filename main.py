@@ -1,23 +1,17 @@
 import os
+import sys
 import discord
 import time
 import asyncio
 import logging
-import subprocess
 import requests
-import zipfile
-import stat
-import shutil
 import random
 import json
+import heapq
+import bisect
 import base58
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+import signal
+import psutil
 from discord.ext import tasks
 from dotenv import load_dotenv
 
@@ -46,10 +40,67 @@ try:
 except ValueError:
     raise ValueError("❌ Channel IDs must be valid integers.")
 
+# Scraper worker settings
+try:
+    SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", "3"))
+    SCRAPER_MAX_RSS_MB = int(os.getenv("SCRAPER_MAX_RSS_MB", "1024"))
+    SCRAPER_REQUEST_TIMEOUT = int(os.getenv("SCRAPER_REQUEST_TIMEOUT", "300"))
+except ValueError:
+    raise ValueError("❌ Scraper settings must be valid integers.")
+
+if SCRAPER_WORKERS < 1:
+    raise ValueError("❌ SCRAPER_WORKERS must be at least 1.")
+if SCRAPER_MAX_RSS_MB <= 0:
+    raise ValueError("❌ SCRAPER_MAX_RSS_MB must be greater than 0.")
+if SCRAPER_REQUEST_TIMEOUT <= 0:
+    raise ValueError("❌ SCRAPER_REQUEST_TIMEOUT must be greater than 0.")
+
+# RPC budget settings (token bucket per endpoint, in weighted requests)
+try:
+    SOLANA_RPC_RATE = float(os.getenv("SOLANA_RPC_RATE", "4"))
+    SOLANA_RPC_BURST = float(os.getenv("SOLANA_RPC_BURST", "10"))
+except ValueError:
+    raise ValueError("❌ RPC budget settings must be valid numbers.")
+
+# Price rendering settings
+PRICE_TICKER_ENABLED = os.getenv("PRICE_TICKER_ENABLED", "false").lower() in ("1", "true", "yes")
+PRICE_TICKER_MESSAGE_ID = os.getenv("PRICE_TICKER_MESSAGE_ID")
+try:
+    PRICE_REFRESH_SECONDS = int(os.getenv("PRICE_REFRESH_SECONDS", "300"))
+    PRICE_MAX_AGE_SECONDS = int(os.getenv("PRICE_MAX_AGE_SECONDS", "900"))
+    PRICE_TICKER_MESSAGE_ID = int(PRICE_TICKER_MESSAGE_ID) if PRICE_TICKER_MESSAGE_ID else None
+except ValueError:
+    raise ValueError("❌ Price refresh settings must be valid integers.")
+
+if PRICE_REFRESH_SECONDS <= 0:
+    raise ValueError("❌ PRICE_REFRESH_SECONDS must be greater than 0.")
+if PRICE_MAX_AGE_SECONDS <= 0:
+    raise ValueError("❌ PRICE_MAX_AGE_SECONDS must be greater than 0.")
+
 # Bot constants
+PRICE_MESSAGE_HEADER = "🧠 **ANA Market Update**"
+PRICE_TICKER_HISTORY_LIMIT = 100  # Recent feed messages searched for an old ticker
 ANA_TOKEN_CONTRACT = "5DkzT65YJvCsZcot9L6qwkJnsBCPmKHjJz3QU7t7QeRW"
 TEAM_WALLET = "BcAoCEdkzV2J21gAjCCEokBw5iMnAe96SbYo9F6QmKWV"
 SOLANA_RPC_URL = "https://api.mainnet-beta.solana.com"
+RPC_METHOD_WEIGHTS = {
+    "getSignaturesForAddress": 1,
+    "getTransaction": 2,
+}
+RPC_PRIORITY_REALTIME = 0
+RPC_PRIORITY_BACKFILL = 1
+RPC_BACKFILL_RESERVE = 0.5  # Share of the burst kept free for real-time calls
+RPC_MAX_RETRIES = 2
+SCRAPER_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraper_worker.py")
+
+# The bucket must be able to hold the heaviest backfill call on top of the reserve
+if SOLANA_RPC_RATE <= 0:
+    raise ValueError("❌ SOLANA_RPC_RATE must be greater than 0.")
+if SOLANA_RPC_BURST < max(RPC_METHOD_WEIGHTS.values()) / (1 - RPC_BACKFILL_RESERVE):
+    raise ValueError(
+        f"❌ SOLANA_RPC_BURST must be at least "
+        f"{max(RPC_METHOD_WEIGHTS.values()) / (1 - RPC_BACKFILL_RESERVE):g}."
+    )
 
 # Setup Discord bot - FIXED FOR PY-CORD
 intents = discord.Intents.default()
@@ -63,392 +114,307 @@ last_prana_price = None
 last_floor_price = None
 last_signature = None
 
-def find_chrome_binary():
-    """Find Chrome/Chromium binary location - copied from your working code"""
-    railway_chrome = os.environ.get("GOOGLE_CHROME_BIN")
-    if railway_chrome and os.path.exists(railway_chrome):
-        logger.info(f"✅ Found Railway Chrome binary: {railway_chrome}")
-        return railway_chrome
-    
-    possible_paths = [
-        "/usr/bin/google-chrome",
-        "/usr/bin/google-chrome-stable",
-        "/usr/bin/chromium",
-        "/usr/bin/chromium-browser",
-        "/snap/bin/chromium",
-        "/usr/bin/chrome",
-        "/opt/google/chrome/google-chrome",
-        "/app/.chrome-for-testing/chrome-linux64/chrome"
-    ]
-    
-    for path in possible_paths:
-        if os.path.exists(path):
-            logger.info(f"✅ Found Chrome binary: {path}")
-            return path
-    
-    logger.error("❌ No Chrome binary found")
-    return None
+# Pre-rendered /price message and the live ticker it feeds
+price_data = {"ana_price": None, "prana_price": None, "floor_price": None}
+price_data_updated_at = {"ana_price": 0.0, "prana_price": 0.0, "floor_price": 0.0}
+price_data_changed_at = None  # When a displayed value last changed
+rendered_price_message = None
+price_refresh_lock = None
+price_ticker_message = None
+ticker_rendered = None  # What the ticker message actually shows
 
-def get_chrome_version(chrome_path):
-    """Get Chrome version - copied from your working code"""
-    try:
-        result = subprocess.run([chrome_path, "--version"], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            version_output = result.stdout.strip()
-            logger.info(f"✅ Chrome version: {version_output}")
-            
-            version_parts = version_output.split()
-            version_number = version_parts[-1]
-            major_version = version_number.split('.')[0]
-            
-            logger.info(f"✅ Chrome major version: {major_version}")
-            return version_number, major_version
-        else:
-            logger.error(f"❌ Failed to get Chrome version: {result.stderr}")
-            return None, None
-    except Exception as e:
-        logger.error(f"❌ Error getting Chrome version: {e}")
-        return None, None
+# Rolling buy statistics: window label -> (window length, bucket size) in seconds
+STATS_WINDOWS = {
+    "1h": (3600, 60),
+    "24h": (86400, 900),
+    "7d": (604800, 3600),
+}
+LEADERBOARD_WINDOW = "7d"
+LEADERBOARD_SIZE = 10
 
-def download_compatible_chromedriver(major_version):
-    """Download ChromeDriver - copied from your working code"""
-    try:
-        railway_chromedriver = os.environ.get("CHROMEDRIVER_PATH")
-        if railway_chromedriver and os.path.exists(railway_chromedriver):
-            logger.info(f"✅ Using Railway ChromeDriver: {railway_chromedriver}")
-            return railway_chromedriver
-        
-        driver_dir = "/tmp/chromedriver_new"
-        driver_path = os.path.join(driver_dir, "chromedriver")
-        
-        if os.path.exists(driver_dir):
-            shutil.rmtree(driver_dir)
-        
-        os.makedirs(driver_dir, exist_ok=True)
-        
-        logger.info(f"📥 Downloading ChromeDriver for Chrome {major_version}...")
+class ScraperWorker:
+    """Supervised scraper subprocess speaking one JSON line per request/response"""
+
+    def __init__(self, worker_id):
+        self.worker_id = worker_id
+        self.process = None
+        self.next_request_id = 0
+        self.start_lock = None  # Created on the bot's event loop
+
+    def is_alive(self):
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        if self.start_lock is None:
+            self.start_lock = asyncio.Lock()
+        async with self.start_lock:
+            if self.is_alive():
+                return
+            self.process = await asyncio.create_subprocess_exec(
+                sys.executable, SCRAPER_WORKER_SCRIPT,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                start_new_session=True  # Own process group, shared with Chrome and ChromeDriver
+            )
+            logger.info(f"🧰 Scraper worker {self.worker_id} started (pid {self.process.pid})")
+
+    async def stop(self, reason):
+        process = self.process
+        if process is None:
+            return
         
-        if int(major_version) >= 115:
-            try:
-                api_url = f"https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{major_version}"
-                logger.info(f"🔍 Checking API: {api_url}")
-                
-                response = requests.get(api_url, timeout=30)
-                if response.status_code == 200:
-                    driver_version = response.text.strip()
-                    logger.info(f"✅ Found ChromeDriver version: {driver_version}")
-                    download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
-                else:
-                    logger.warning(f"⚠️ API returned {response.status_code}, using fallback version")
-                    if major_version == "138":
-                        driver_version = "138.0.6906.100"
-                    else:
-                        driver_version = f"{major_version}.0.6000.0"
-                    download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ New API failed: {e}, using fallback")
-                if major_version == "138":
-                    driver_version = "138.0.6906.100"
-                else:
-                    driver_version = f"{major_version}.0.6000.0"
-                download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
+        if process.returncode is None:
+            logger.warning(f"⚠️ Stopping scraper worker {self.worker_id}: {reason}")
         else:
-            api_url = f"https://chromedriver.storage.googleapis.com/LATEST_RELEASE_{major_version}"
-            try:
-                response = requests.get(api_url, timeout=30)
-                if response.status_code == 200:
-                    driver_version = response.text.strip()
-                    download_url = f"https://chromedriver.storage.googleapis.com/{driver_version}/chromedriver_linux64.zip"
-                else:
-                    raise Exception(f"Old API returned status {response.status_code}")
-            except Exception as e:
-                logger.error(f"❌ Failed to get ChromeDriver version for Chrome {major_version}: {e}")
-                return None
+            logger.warning(f"⚠️ Cleaning up exited scraper worker {self.worker_id}: {reason}")
         
-        logger.info(f"📥 Downloading ChromeDriver {driver_version} from: {download_url}")
+        # Kill the whole process group so Chrome and ChromeDriver go too,
+        # including any left orphaned by a worker that died on its own
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        
+        await process.wait()
+        if self.process is process:
+            self.process = None
+
+    def memory_bytes(self):
+        """Unique memory (USS) of the worker and its browser processes
+
+        Chrome's processes share many pages, so summing RSS would count
+        them several times over.
+        """
+        try:
+            process = psutil.Process(self.process.pid)
+            total = process.memory_full_info().uss
+            for child in process.children(recursive=True):
+                try:
+                    total += child.memory_full_info().uss
+                except psutil.Error:
+                    pass
+            return total
+        except psutil.Error:
+            return 0
+
+    async def fetch(self, url, data_type):
+        if not self.is_alive():
+            await self.stop("worker exited")
+            await self.start()
         
-        zip_path = os.path.join(driver_dir, "chromedriver.zip")
+        self.next_request_id += 1
+        request_id = self.next_request_id
         
         try:
-            response = requests.get(download_url, timeout=120)
-            response.raise_for_status()
-            
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            request = {"id": request_id, "url": url, "data_type": data_type}
+            self.process.stdin.write((json.dumps(request) + "\n").encode())
+            await self.process.stdin.drain()
             
-            logger.info("📂 Extracting ChromeDriver...")
+            line = await asyncio.wait_for(self.process.stdout.readline(), timeout=SCRAPER_REQUEST_TIMEOUT)
+            if not line:
+                raise ConnectionError("worker exited mid-request")
             
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(driver_dir)
-            
-            chromedriver_found = False
-            for root, dirs, files in os.walk(driver_dir):
-                for file in files:
-                    if file == "chromedriver":
-                        extracted_path = os.path.join(root, file)
-                        if extracted_path != driver_path:
-                            shutil.move(extracted_path, driver_path)
-                        chromedriver_found = True
-                        break
-                if chromedriver_found:
-                    break
+            response = json.loads(line)
+            if response.get("id") != request_id:
+                raise ValueError(f"unexpected response id {response.get('id')}")
+            return response.get("value")
             
-            if not chromedriver_found:
-                logger.error("❌ ChromeDriver executable not found in downloaded files")
-                return None
-            
-            os.chmod(driver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-            os.remove(zip_path)
-            
-            logger.info("🧪 Testing downloaded ChromeDriver...")
-            result = subprocess.run([driver_path, "--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                logger.info(f"✅ ChromeDriver working: {result.stdout.strip()}")
-                return driver_path
-            else:
-                logger.error(f"❌ Downloaded ChromeDriver test failed: {result.stderr}")
-                return None
-                
-        except requests.RequestException as e:
-            logger.error(f"❌ Failed to download ChromeDriver: {e}")
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Scraper worker {self.worker_id} timed out fetching {data_type}")
+            await self.stop("request timeout")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Scraper worker {self.worker_id} failed fetching {data_type}: {e}")
+            await self.stop("protocol error")
             return None
-            
-    except Exception as e:
-        logger.error(f"❌ ChromeDriver download error: {e}")
-        return None
 
-def setup_chromedriver_and_chrome():
-    """Setup ChromeDriver - copied from your working code"""
-    try:
-        chrome_binary = find_chrome_binary()
-        if not chrome_binary:
-            logger.error("❌ Chrome binary not found")
-            return None, None
-        
-        chrome_version, major_version = get_chrome_version(chrome_binary)
-        if not chrome_version or not major_version:
-            logger.error("❌ Could not determine Chrome version")
-            return None, None
-        
-        logger.info("📥 Downloading compatible ChromeDriver...")
-        chromedriver_path = download_compatible_chromedriver(major_version)
-        
-        if not chromedriver_path:
-            logger.error("❌ Could not download compatible ChromeDriver")
-            return None, None
+class ScraperPool:
+    """Small pool of scraper workers handed out one request at a time"""
+
+    def __init__(self, size):
+        self.workers = [ScraperWorker(i + 1) for i in range(size)]
+        self.idle = None
+
+    async def start(self):
+        if self.idle is not None:
+            return
+        self.idle = asyncio.Queue()
+        for worker in self.workers:
+            await worker.start()
+            self.idle.put_nowait(worker)
+
+    async def fetch(self, url, data_type):
+        if self.idle is None:
+            await self.start()
         
-        logger.info(f"✅ ChromeDriver setup complete: {chromedriver_path}")
-        return chromedriver_path, chrome_binary
+        worker = await self.idle.get()
+        try:
+            return await worker.fetch(url, data_type)
+        finally:
+            self.idle.put_nowait(worker)
+
+    async def supervise(self):
+        """Enforce the memory cap and restart any worker that died"""
+        max_memory = SCRAPER_MAX_RSS_MB * 1024 * 1024
+        for worker in self.workers:
+            if not worker.is_alive():
+                await worker.stop("worker exited")
+                await worker.start()
+                continue
             
-    except Exception as e:
-        logger.error(f"❌ ChromeDriver setup error: {e}")
-        return None, None
+            memory = worker.memory_bytes()
+            if memory > max_memory:
+                await worker.stop(f"memory {memory // (1024 * 1024)} MB over {SCRAPER_MAX_RSS_MB} MB limit")
+                await worker.start()
 
-def create_chrome_options(chrome_binary):
-    """Create Chrome options - copied from your working code"""
-    options = Options()
-    
-    options.binary_location = chrome_binary
-    
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-plugins")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--remote-debugging-port=9222")
-    
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-software-rasterizer")
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    options.add_argument("--disable-features=TranslateUI")
-    options.add_argument("--disable-features=VizDisplayCompositor")
-    options.add_argument("--disable-ipc-flooding-protection")
-    options.add_argument("--memory-pressure-off")
-    
-    options.add_argument("--max_old_space_size=4096")
-    options.add_argument("--disable-logging")
-    options.add_argument("--disable-dev-tools")
-    options.add_argument("--log-level=3")
-    options.add_argument("--silent")
-    
-    options.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    return options
+scraper_pool = ScraperPool(SCRAPER_WORKERS)
 
-def wait_for_page_ready(driver, timeout=60):
-    """Wait for page ready - copied from your working code"""
-    try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
-        
-        time.sleep(3)
-        
+class RpcScheduler:
+    """Token-bucket request budget for one RPC endpoint, shared by all callers"""
+
+    def __init__(self, url, rate, burst):
+        self.url = url
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.realtime_waiting = 0
+        self.requests_by_method = {}
+        self.weight_spent = 0
+        self.rate_limited = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        return now
+
+    async def acquire(self, method, priority=RPC_PRIORITY_REALTIME):
+        weight = RPC_METHOD_WEIGHTS.get(method, 1)
+        # Backfill only spends tokens above the real-time reserve
+        reserve = 0 if priority == RPC_PRIORITY_REALTIME else self.burst * RPC_BACKFILL_RESERVE
+        started_at = time.monotonic()
+        
+        if priority == RPC_PRIORITY_REALTIME:
+            self.realtime_waiting += 1
         try:
-            WebDriverWait(driver, 10).until(
-                lambda d: d.execute_script("return typeof jQuery === 'undefined' || jQuery.active === 0")
-            )
-        except:
-            pass
-        
-        logger.info("✅ Page fully loaded")
-        return True
-        
-    except TimeoutException:
-        logger.warning("⚠️ Page load timeout, continuing anyway")
-        return False
+            while True:
+                now = self._refill()
+                
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                
+                if priority != RPC_PRIORITY_REALTIME and self.realtime_waiting:
+                    await asyncio.sleep(weight / self.rate)
+                    continue
+                
+                if self.tokens - weight >= reserve:
+                    self.tokens -= weight
+                    break
+                
+                await asyncio.sleep((weight + reserve - self.tokens) / self.rate)
+        finally:
+            if priority == RPC_PRIORITY_REALTIME:
+                self.realtime_waiting -= 1
+        
+        self.requests_by_method[method] = self.requests_by_method.get(method, 0) + 1
+        self.weight_spent += weight
+        self.wait_seconds += time.monotonic() - started_at
+
+    def on_rate_limited(self, retry_after=None):
+        """Back off after a 429: honour Retry-After and halve the rate"""
+        self.rate_limited += 1
+        try:
+            delay = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            delay = 0.0
+        delay = max(delay, self.burst / self.rate)
+        
+        self.paused_until = max(self.paused_until, time.monotonic() + delay)
+        self.rate = max(self.max_rate / 16, self.rate / 2)
+        self.tokens = 0.0
+        logger.warning(f"⚠️ RPC rate limited, pausing {delay:.1f}s and lowering budget to {self.rate:.2f} req/s")
+
+    def on_success(self):
+        """Recover the configured rate gradually after a back-off"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def usage(self):
+        self._refill()
+        return {
+            "rate": self.rate,
+            "max_rate": self.max_rate,
+            "tokens": self.tokens,
+            "burst": self.burst,
+            "weight_spent": self.weight_spent,
+            "requests": dict(self.requests_by_method),
+            "rate_limited": self.rate_limited,
+            "wait_seconds": self.wait_seconds,
+        }
 
-def fetch_nirvana_data(url, data_type):
-    """Fetch data from Nirvana Finance pages"""
-    driver = None
+rpc_schedulers = {}
+
+def get_rpc_scheduler(url):
+    """Return the shared scheduler for an RPC endpoint"""
+    if url not in rpc_schedulers:
+        rpc_schedulers[url] = RpcScheduler(url, SOLANA_RPC_RATE, SOLANA_RPC_BURST)
+    return rpc_schedulers[url]
+
+async def rpc_call(method, params, priority=RPC_PRIORITY_REALTIME, url=SOLANA_RPC_URL):
+    """Make a budgeted JSON-RPC call and return its result, or None on failure"""
+    scheduler = get_rpc_scheduler(url)
+    headers = {"Content-Type": "application/json"}
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": method,
+        "params": params
+    }
+    loop = asyncio.get_event_loop()
     
-    try:
-        logger.info(f"🔄 Fetching {data_type} from {url}")
-        
-        chromedriver_path, chrome_binary = setup_chromedriver_and_chrome()
-        if not chromedriver_path or not chrome_binary:
-            logger.error("❌ Chrome/ChromeDriver setup failed")
-            return None
-        
-        options = create_chrome_options(chrome_binary)
-        service = Service(executable_path=chromedriver_path)
-        
-        logger.info("🚀 Starting Chrome WebDriver...")
-        driver = webdriver.Chrome(service=service, options=options)
+    for attempt in range(RPC_MAX_RETRIES + 1):
+        await scheduler.acquire(method, priority)
         
-        driver.set_page_load_timeout(120)
-        driver.implicitly_wait(10)
-        
-        logger.info(f"🌐 Loading {url}...")
-        driver.get(url)
-        
-        logger.info("⏳ Waiting for page to be fully loaded...")
-        wait_for_page_ready(driver, timeout=90)
-        
-        time.sleep(10)
-        
-        wait = WebDriverWait(driver, 60)
-        
-        selectors_to_try = [
-            ("CLASS_NAME", "DataPoint_dataPointValue__Bzf_E"),
-            ("CSS_SELECTOR", "[class*='DataPoint_dataPointValue']"),
-            ("CSS_SELECTOR", "[class*='dataPointValue']"),
-        ]
+        response = await loop.run_in_executor(
+            None, lambda: requests.post(url, json=payload, headers=headers, timeout=30)
+        )
         
-        data_text = None
+        if response.status_code == 429:
+            scheduler.on_rate_limited(response.headers.get("Retry-After"))
+            continue
         
-        for selector_type, selector in selectors_to_try:
-            try:
-                logger.info(f"🔍 Trying {selector_type}: {selector}")
-                
-                if selector_type == "CLASS_NAME":
-                    elements = wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, selector)))
-                elif selector_type == "CSS_SELECTOR":
-                    elements = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-                
-                # For mint page, get first element (ANA price)
-                # For realize page, we need to identify which element based on context
-                if "mint" in url:
-                    element = elements[0] if elements else None
-                elif "realize" in url:
-                    # Floor price is typically first, prANA might be second
-                    if data_type == "floor_price":
-                        element = elements[0] if elements else None
-                    elif data_type == "prana_price":
-                        element = elements[1] if len(elements) > 1 else None
-                    else:
-                        element = elements[0] if elements else None
-                else:
-                    element = elements[0] if elements else None
-                
-                if element:
-                    wait.until(EC.visibility_of(element))
-                    time.sleep(5)
-                    
-                    data_text = element.text.strip()
-                    logger.info(f"📝 Found {data_type}: '{data_text}'")
-                    
-                    if data_text and data_text != "":
-                        break
-                        
-            except TimeoutException:
-                logger.debug(f"⏳ {selector_type} '{selector}' timed out")
-                continue
-            except Exception as e:
-                logger.debug(f"⚠️ {selector_type} '{selector}' failed: {e}")
-                continue
+        if response.status_code == 200:
+            scheduler.on_success()
+            data = response.json()
+            return data.get("result")
         
-        if data_text:
-            # Clean the data
-            cleaned_data = data_text.replace("USDC", "").replace("$", "").replace(",", "").strip()
-            
-            logger.info(f"🧹 Cleaned '{data_text}' to '{cleaned_data}'")
-            
-            if cleaned_data:
-                try:
-                    float(cleaned_data)
-                    logger.info(f"✅ Valid {data_type} extracted: {cleaned_data}")
-                    return cleaned_data
-                except ValueError:
-                    logger.warning(f"⚠️ Invalid number format: '{cleaned_data}'")
-                    return None
-            else:
-                logger.warning(f"⚠️ {data_type} text empty after cleaning")
-                return None
-        else:
-            logger.warning(f"⚠️ No {data_type} found")
-            return None
-            
-    except Exception as e:
-        logger.error(f"❌ Error fetching {data_type}: {e}")
+        logger.warning(f"⚠️ RPC {method} returned {response.status_code}")
         return None
-        
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info("🔄 Chrome WebDriver closed")
-            except Exception as close_error:
-                logger.warning(f"⚠️ Error closing WebDriver: {close_error}")
+    
+    logger.warning(f"⚠️ RPC {method} still rate limited after {RPC_MAX_RETRIES} retries")
+    return None
 
 async def get_solana_transactions():
     """Monitor Solana blockchain for ANA mint transactions"""
     try:
-        headers = {"Content-Type": "application/json"}
-        
         # Get recent signatures for the token account
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "getSignaturesForAddress",
-            "params": [
+        signatures = await rpc_call(
+            "getSignaturesForAddress",
+            [
                 ANA_TOKEN_CONTRACT,
                 {
                     "limit": 10,
                     "commitment": "confirmed"
                 }
             ]
-        }
-        
-        response = requests.post(SOLANA_RPC_URL, json=payload, headers=headers, timeout=30)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if "result" in data and data["result"]:
-                signatures = data["result"]
-                return signatures
+        )
         
-        return []
+        return signatures or []
         
     except Exception as e:
         logger.error(f"❌ Error fetching Solana transactions: {e}")
@@ -457,13 +423,9 @@ async def get_solana_transactions():
 async def analyze_transaction(signature):
     """Analyze a transaction to detect ANA buys"""
     try:
-        headers = {"Content-Type": "application/json"}
-        
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "getTransaction",
-            "params": [
+        transaction = await rpc_call(
+            "getTransaction",
+            [
                 signature,
                 {
                     "encoding": "json",
@@ -471,55 +433,50 @@ async def analyze_transaction(signature):
                     "maxSupportedTransactionVersion": 0
                 }
             ]
-        }
-        
-        response = requests.post(SOLANA_RPC_URL, json=payload, headers=headers, timeout=30)
+        )
         
-        if response.status_code == 200:
-            data = response.json()
-            if "result" in data and data["result"]:
-                transaction = data["result"]
+        if transaction:
+            # Look for mint transactions
+            if transaction.get("meta", {}).get("err") is None:
+                # Check if this is a mint transaction by looking at the instructions
+                instructions = transaction.get("transaction", {}).get("message", {}).get("instructions", [])
                 
-                # Look for mint transactions
-                if transaction.get("meta", {}).get("err") is None:
-                    # Check if this is a mint transaction by looking at the instructions
-                    instructions = transaction.get("transaction", {}).get("message", {}).get("instructions", [])
-                    
-                    for instruction in instructions:
-                        # Look for token program instructions that might be mints
-                        program_id_index = instruction.get("programIdIndex")
-                        if program_id_index is not None:
-                            accounts = transaction.get("transaction", {}).get("message", {}).get("accountKeys", [])
-                            if program_id_index < len(accounts):
-                                program_id = accounts[program_id_index]
+                for instruction in instructions:
+                    # Look for token program instructions that might be mints
+                    program_id_index = instruction.get("programIdIndex")
+                    if program_id_index is not None:
+                        accounts = transaction.get("transaction", {}).get("message", {}).get("accountKeys", [])
+                        if program_id_index < len(accounts):
+                            program_id = accounts[program_id_index]
+                            
+                            # Check if this is a token program
+                            if program_id in ["TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA", "11111111111111111111111111111112"]:
+                                # Analyze account changes to find the buyer
+                                pre_balances = transaction.get("meta", {}).get("preBalances", [])
+                                post_balances = transaction.get("meta", {}).get("postBalances", [])
                                 
-                                # Check if this is a token program
-                                if program_id in ["TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA", "11111111111111111111111111111112"]:
-                                    # Analyze account changes to find the buyer
-                                    pre_balances = transaction.get("meta", {}).get("preBalances", [])
-                                    post_balances = transaction.get("meta", {}).get("postBalances", [])
-                                    
-                                    for i, (pre, post) in enumerate(zip(pre_balances, post_balances)):
-                                        if pre > post and i < len(accounts):  # SOL was spent
-                                            buyer_account = accounts[i]
+                                for i, (pre, post) in enumerate(zip(pre_balances, post_balances)):
+                                    if pre > post and i < len(accounts):  # SOL was spent
+                                        buyer_account = accounts[i]
+                                        
+                                        # Exclude team wallet
+                                        if buyer_account != TEAM_WALLET:
+                                            sol_spent = (pre - post) / 1000000000  # Convert lamports to SOL
                                             
-                                            # Exclude team wallet
-                                            if buyer_account != TEAM_WALLET:
-                                                sol_spent = (pre - post) / 1000000000  # Convert lamports to SOL
+                                            if sol_spent > 0.01:  # Minimum threshold to avoid tiny transactions
+                                                logger.info(f"🎯 Buy detected: {buyer_account} spent {sol_spent} SOL")
+                                                
+                                                # Get current SOL price for USD conversion
+                                                sol_price_usd = await get_sol_price()
+                                                usd_amount = sol_spent * sol_price_usd if sol_price_usd else 0
                                                 
-                                                if sol_spent > 0.01:  # Minimum threshold to avoid tiny transactions
-                                                    logger.info(f"🎯 Buy detected: {buyer_account} spent {sol_spent} SOL")
-                                                    
-                                                    # Get current SOL price for USD conversion
-                                                    sol_price_usd = await get_sol_price()
-                                                    usd_amount = sol_spent * sol_price_usd if sol_price_usd else 0
-                                                    
-                                                    return {
-                                                        "buyer": buyer_account,
-                                                        "sol_amount": sol_spent,
-                                                        "usd_amount": usd_amount,
-                                                        "signature": signature
-                                                    }
+                                                return {
+                                                    "buyer": buyer_account,
+                                                    "sol_amount": sol_spent,
+                                                    "usd_amount": usd_amount,
+                                                    "signature": signature,
+                                                    "timestamp": transaction.get("blockTime")
+                                                }
         
         return None
         
@@ -538,6 +495,272 @@ async def get_sol_price():
     except:
         return 150  # Fallback price
 
+def format_wallet(address):
+    """Truncate a wallet address for display"""
+    return f"{address[:3]}...{address[-3:]}"
+
+class RollingWindow:
+    """Time-bucketed ring buffer with running buy volume and count totals"""
+
+    def __init__(self, window_seconds, bucket_seconds):
+        self.bucket_seconds = bucket_seconds
+        self.num_buckets = window_seconds // bucket_seconds
+        self.sol = [0.0] * self.num_buckets
+        self.usd = [0.0] * self.num_buckets
+        self.counts = [0] * self.num_buckets
+        self.total_sol = 0.0
+        self.total_usd = 0.0
+        self.total_count = 0
+        self.head = None  # Absolute index of the newest bucket
+
+    def _advance(self, now):
+        current = int(now // self.bucket_seconds)
+        if self.head is None:
+            self.head = current
+            return
+        if current <= self.head:
+            return
+        
+        # Clear every bucket that fell out of the window since the last advance
+        for offset in range(1, min(current - self.head, self.num_buckets) + 1):
+            i = (self.head + offset) % self.num_buckets
+            self.total_sol -= self.sol[i]
+            self.total_usd -= self.usd[i]
+            self.total_count -= self.counts[i]
+            self.sol[i] = 0.0
+            self.usd[i] = 0.0
+            self.counts[i] = 0
+        
+        if self.total_count == 0:
+            # Drop accumulated float error once the window is empty
+            self.total_sol = 0.0
+            self.total_usd = 0.0
+        
+        self.head = current
+
+    def add(self, timestamp, sol_amount, usd_amount):
+        self._advance(max(timestamp, time.time()))
+        bucket = int(timestamp // self.bucket_seconds)
+        if bucket <= self.head - self.num_buckets:
+            return  # Older than the window
+        
+        i = bucket % self.num_buckets
+        self.sol[i] += sol_amount
+        self.usd[i] += usd_amount
+        self.counts[i] += 1
+        self.total_sol += sol_amount
+        self.total_usd += usd_amount
+        self.total_count += 1
+
+    def totals(self, now=None):
+        self._advance(now if now is not None else time.time())
+        return self.total_sol, self.total_usd, self.total_count
+
+class WalletLeaderboard:
+    """Per-wallet rolling totals with a lazily maintained top-K heap"""
+
+    def __init__(self, window_seconds, bucket_seconds):
+        self.bucket_seconds = bucket_seconds
+        self.num_buckets = window_seconds // bucket_seconds
+        self.bucket_order = []  # Sorted absolute bucket indexes still in the window
+        self.buckets = {}  # bucket index -> {wallet: [sol, usd, count]}
+        self.wallets = {}  # wallet -> [sol, usd, count]
+        self.heap = []  # (-sol, wallet) entries, stale ones skipped on read
+
+    def _advance(self, now):
+        oldest = int(now // self.bucket_seconds) - self.num_buckets
+        while self.bucket_order and self.bucket_order[0] <= oldest:
+            expired = self.buckets.pop(self.bucket_order.pop(0))
+            for wallet, (sol, usd, count) in expired.items():
+                totals = self.wallets[wallet]
+                totals[2] -= count
+                if totals[2] <= 0:
+                    del self.wallets[wallet]
+                    continue
+                totals[0] -= sol
+                totals[1] -= usd
+                heapq.heappush(self.heap, (-totals[0], wallet))
+        self._compact()
+
+    def _compact(self, k=LEADERBOARD_SIZE):
+        """Rebuild the heap once stale entries dominate it"""
+        if len(self.heap) > 2 * len(self.wallets) + k:
+            self.heap = [(-totals[0], wallet) for wallet, totals in self.wallets.items()]
+            heapq.heapify(self.heap)
+
+    def add(self, timestamp, wallet, sol_amount, usd_amount):
+        self._advance(time.time())
+        bucket = int(timestamp // self.bucket_seconds)
+        if bucket <= int(time.time() // self.bucket_seconds) - self.num_buckets:
+            return  # Older than the window
+        
+        if bucket not in self.buckets:
+            self.buckets[bucket] = {}
+            bisect.insort(self.bucket_order, bucket)
+        
+        entry = self.buckets[bucket].setdefault(wallet, [0.0, 0.0, 0])
+        entry[0] += sol_amount
+        entry[1] += usd_amount
+        entry[2] += 1
+        
+        totals = self.wallets.setdefault(wallet, [0.0, 0.0, 0])
+        totals[0] += sol_amount
+        totals[1] += usd_amount
+        totals[2] += 1
+        heapq.heappush(self.heap, (-totals[0], wallet))
+        self._compact()
+
+    def top(self, k, now=None):
+        """Return up to k (wallet, sol, usd, count) tuples ordered by SOL spent"""
+        self._advance(now if now is not None else time.time())
+        self._compact(k)
+        
+        results = []
+        valid = []
+        while self.heap and len(results) < k:
+            neg_sol, wallet = heapq.heappop(self.heap)
+            totals = self.wallets.get(wallet)
+            if not totals or totals[0] != -neg_sol or any(r[0] == wallet for r in results):
+                continue  # Stale entry superseded by a newer push
+            valid.append((neg_sol, wallet))
+            results.append((wallet, totals[0], totals[1], totals[2]))
+        
+        for item in valid:
+            heapq.heappush(self.heap, item)
+        
+        return results
+
+class BuyStats:
+    """Incrementally maintained aggregates over the detected-buy stream"""
+
+    def __init__(self):
+        self.windows = {
+            label: RollingWindow(window_seconds, bucket_seconds)
+            for label, (window_seconds, bucket_seconds) in STATS_WINDOWS.items()
+        }
+        leaderboard_window, leaderboard_bucket = STATS_WINDOWS[LEADERBOARD_WINDOW]
+        self.leaderboard = WalletLeaderboard(leaderboard_window, leaderboard_bucket)
+        self.started_at = time.time()
+
+    def record_buy(self, buy_data):
+        timestamp = buy_data.get("timestamp") or time.time()
+        for window in self.windows.values():
+            window.add(timestamp, buy_data["sol_amount"], buy_data["usd_amount"])
+        self.leaderboard.add(timestamp, buy_data["buyer"], buy_data["sol_amount"], buy_data["usd_amount"])
+
+    def snapshot(self):
+        now = time.time()
+        return {label: window.totals(now) for label, window in self.windows.items()}
+
+    def top_buyers(self, k=LEADERBOARD_SIZE):
+        return self.leaderboard.top(k)
+
+buy_stats = BuyStats()
+
+def render_price_message(data, changed_at):
+    """Build the /price message from the latest scraped values"""
+    updated_line = f"Updated <t:{int(changed_at)}:R>\n" if changed_at else ""
+    return f"""{PRICE_MESSAGE_HEADER} 
+• **ANA Price:** ${data['ana_price'] or 'N/A'}
+• **prANA Price:** ${data['prana_price'] or 'N/A'}
+• **Floor Price:** ${data['floor_price'] or 'N/A'}
+{updated_line}Powered by Nirvana Protocol. Stay informed, stay sharp. ⚡"""
+
+async def find_price_ticker(channel):
+    """Find an existing ticker to reuse: the configured one, else our latest in the feed"""
+    if PRICE_TICKER_MESSAGE_ID:
+        try:
+            message = await channel.fetch_message(PRICE_TICKER_MESSAGE_ID)
+            if message.author == bot.user:
+                return message
+            logger.warning(f"⚠️ Ticker message {PRICE_TICKER_MESSAGE_ID} was not posted by the bot, ignoring it")
+        except discord.HTTPException as e:
+            logger.warning(f"⚠️ Could not load ticker message {PRICE_TICKER_MESSAGE_ID}: {e}")
+    
+    try:
+        async for message in channel.history(limit=PRICE_TICKER_HISTORY_LIMIT):
+            if message.author == bot.user and message.content.startswith(PRICE_MESSAGE_HEADER):
+                logger.info(f"📌 Reusing price ticker (message {message.id})")
+                return message
+    except discord.HTTPException as e:
+        logger.warning(f"⚠️ Could not search feed history for the price ticker: {e}")
+    
+    return None
+
+async def update_price_ticker(message):
+    """Edit the live ticker in the price feed channel, posting it if needed"""
+    global price_ticker_message, ticker_rendered
+    
+    channel = bot.get_channel(PRICE_FEED_CHANNEL_ID)
+    if not channel:
+        logger.warning(f"⚠️ Price Feed Channel {PRICE_FEED_CHANNEL_ID} not found, ticker not updated")
+        return
+    
+    if price_ticker_message is None:
+        price_ticker_message = await find_price_ticker(channel)
+    
+    if price_ticker_message is not None:
+        try:
+            await price_ticker_message.edit(content=message)
+            ticker_rendered = message
+            logger.info("✏️ Price ticker updated")
+            return
+        except (discord.NotFound, discord.Forbidden) as e:
+            logger.warning(f"⚠️ Price ticker message can't be edited ({e}), posting a new one")
+            price_ticker_message = None
+    
+    price_ticker_message = await channel.send(message)
+    ticker_rendered = message
+    logger.info(f"📌 Price ticker posted (message {price_ticker_message.id})")
+
+async def refresh_price_data(if_missing=False):
+    """Scrape prices and re-render the /price message if anything changed"""
+    global rendered_price_message, price_refresh_lock, price_data_changed_at
+    
+    if price_refresh_lock is None:
+        price_refresh_lock = asyncio.Lock()
+    
+    async with price_refresh_lock:
+        if if_missing and rendered_price_message:
+            return  # An in-flight refresh already rendered it
+        
+        logger.info("📊 Fetching ANA market data...")
+        
+        # Fetch data in parallel across the scraper workers
+        ana_price_task = scraper_pool.fetch("https://mainnet.nirvana.finance/mint", "ana_price")
+        floor_price_task = scraper_pool.fetch("https://mainnet.nirvana.finance/realize", "floor_price")
+        prana_price_task = scraper_pool.fetch("https://mainnet.nirvana.finance/realize", "prana_price")
+        
+        ana_price, floor_price, prana_price = await asyncio.gather(ana_price_task, floor_price_task, prana_price_task)
+        
+        await check_floor_price(floor_price)
+        
+        # Keep the last good value when a scrape fails, until it gets too old
+        now = time.time()
+        previous_data = dict(price_data)
+        for key, value in (("ana_price", ana_price), ("floor_price", floor_price), ("prana_price", prana_price)):
+            if value:
+                price_data[key] = value
+                price_data_updated_at[key] = now
+            elif now - price_data_updated_at[key] > PRICE_MAX_AGE_SECONDS:
+                price_data[key] = None
+        
+        if price_data != previous_data:
+            price_data_changed_at = now
+        
+        message = render_price_message(price_data, price_data_changed_at)
+        if message != rendered_price_message:
+            rendered_price_message = message
+            logger.info("📊 Price message re-rendered")
+        else:
+            logger.info("📊 Price data unchanged")
+        
+        if PRICE_TICKER_ENABLED and message != ticker_rendered:
+            try:
+                await update_price_ticker(message)
+            except discord.HTTPException as e:
+                logger.error(f"❌ Price ticker update failed: {e}")
+
 @bot.slash_command(name="price", description="Get current ANA market update")
 async def price_command(ctx):
     """Slash command to show ANA market data"""
@@ -545,41 +768,66 @@ async def price_command(ctx):
         await ctx.respond("❌ This command can only be used in the price discussion channel.", ephemeral=True)
         return
     
-    await ctx.defer()
+    try:
+        if rendered_price_message:
+            await ctx.respond(rendered_price_message)
+            logger.info("✅ Price command executed successfully")
+            return
+        
+        # Nothing rendered yet (bot just started), wait for the first refresh
+        await ctx.defer()
+        await refresh_price_data(if_missing=True)
+        await ctx.followup.send(rendered_price_message)
+        logger.info("✅ Price command executed successfully")
+        
+    except Exception as e:
+        logger.error(f"❌ Price command error: {e}")
+        await ctx.respond("❌ Error fetching price data. Please try again later.")
+
+@bot.slash_command(name="stats", description="Get rolling ANA buy volume")
+async def stats_command(ctx):
+    """Slash command to show rolling buy volume and counts"""
+    if ctx.channel.id != PRICE_DISCUSSION_CHANNEL_ID:
+        await ctx.respond("❌ This command can only be used in the price discussion channel.", ephemeral=True)
+        return
     
     try:
-        # Fetch all price data
-        logger.info("📊 Fetching ANA market data...")
+        lines = ["📊 **ANA Buy Stats**"]
+        for label, (sol_total, usd_total, count) in buy_stats.snapshot().items():
+            lines.append(f"• **{label}:** {count} buys · **{sol_total:.2f} SOL** (~${usd_total:,.0f})")
+        lines.append(f"Tracking since <t:{int(buy_stats.started_at)}:R>.")
         
-        # Fetch data in parallel using asyncio
-        loop = asyncio.get_event_loop()
+        await ctx.respond("\n".join(lines))
+        logger.info("✅ Stats command executed successfully")
+        
+    except Exception as e:
+        logger.error(f"❌ Stats command error: {e}")
+        await ctx.respond("❌ Error fetching buy stats. Please try again later.")
+
+@bot.slash_command(name="leaderboard", description="Get the top ANA buyers this week")
+async def leaderboard_command(ctx):
+    """Slash command to show the top buyers over the leaderboard window"""
+    if ctx.channel.id != PRICE_DISCUSSION_CHANNEL_ID:
+        await ctx.respond("❌ This command can only be used in the price discussion channel.", ephemeral=True)
+        return
+    
+    try:
+        top_buyers = buy_stats.top_buyers()
         
-        ana_price_task = loop.run_in_executor(None, fetch_nirvana_data, "https://mainnet.nirvana.finance/mint", "ana_price")
-        floor_price_task = loop.run_in_executor(None, fetch_nirvana_data, "https://mainnet.nirvana.finance/realize", "floor_price")
-        prana_price_task = loop.run_in_executor(None, fetch_nirvana_data, "https://mainnet.nirvana.finance/realize", "prana_price")
+        if not top_buyers:
+            await ctx.respond(f"🏆 No ANA buys detected in the last {LEADERBOARD_WINDOW} yet.")
+            return
         
-        ana_price, floor_price, prana_price = await asyncio.gather(ana_price_task, floor_price_task, prana_price_task)
+        lines = [f"🏆 **Top ANA Buyers ({LEADERBOARD_WINDOW})**"]
+        for rank, (wallet, sol_total, usd_total, count) in enumerate(top_buyers, start=1):
+            lines.append(f"{rank}. `{format_wallet(wallet)}` — **{sol_total:.2f} SOL** (~${usd_total:,.0f}) over {count} buys")
         
-        if not ana_price:
-            ana_price = "N/A"
-        if not floor_price:
-            floor_price = "N/A"
-        if not prana_price:
-            prana_price = "N/A"
-        
-        # Format the message
-        message = f"""🧠 **ANA Market Update** 
-• **ANA Price:** ${ana_price}
-• **prANA Price:** ${prana_price}
-• **Floor Price:** ${floor_price}
-Powered by Nirvana Protocol. Stay informed, stay sharp. ⚡"""
-        
-        await ctx.followup.send(message)
-        logger.info("✅ Price command executed successfully")
+        await ctx.respond("\n".join(lines))
+        logger.info("✅ Leaderboard command executed successfully")
         
     except Exception as e:
-        logger.error(f"❌ Price command error: {e}")
-        await ctx.followup.send("❌ Error fetching price data. Please try again later.")
+        logger.error(f"❌ Leaderboard command error: {e}")
+        await ctx.respond("❌ Error fetching leaderboard. Please try again later.")
 
 @tasks.loop(seconds=60)  # Check every minute
 async def monitor_transactions():
@@ -606,11 +854,13 @@ async def monitor_transactions():
                     buy_data = await analyze_transaction(signature)
                     
                     if buy_data:
+                        buy_stats.record_buy(buy_data)
+                        
                         # Send buy alert
                         channel = bot.get_channel(PRICE_FEED_CHANNEL_ID)
                         if channel:
                             # Truncate wallet address for display
-                            wallet_display = f"{buy_data['buyer'][:3]}...{buy_data['buyer'][-3:]}"
+                            wallet_display = format_wallet(buy_data['buyer'])
                             
                             message = f"""🚨 ANA Buy Detected
 Wallet `{wallet_display}` just bought ANA for **{buy_data['sol_amount']:.2f} SOL** (~${buy_data['usd_amount']:.0f}).
@@ -625,17 +875,13 @@ ANA's floor remains unshaken 🛡️"""
     except Exception as e:
         logger.error(f"❌ Transaction monitoring error: {e}")
 
-@tasks.loop(seconds=300)  # Check every 5 minutes
-async def monitor_floor_price():
-    """Monitor for floor price increases"""
+async def check_floor_price(current_floor):
+    """Alert on floor price increases, fed by the shared price refresh"""
     global last_floor_price
     
     try:
         logger.info("📈 Checking floor price...")
         
-        loop = asyncio.get_event_loop()
-        current_floor = await loop.run_in_executor(None, fetch_nirvana_data, "https://mainnet.nirvana.finance/realize", "floor_price")
-        
         if current_floor and current_floor != "N/A":
             current_floor_float = float(current_floor)
             
@@ -655,6 +901,37 @@ your profit is lockin forever"""
     except Exception as e:
         logger.error(f"❌ Floor price monitoring error: {e}")
 
+@tasks.loop(seconds=15)  # Check every 15 seconds
+async def supervise_scrapers():
+    """Keep scraper workers alive and under their memory cap"""
+    try:
+        await scraper_pool.supervise()
+    except Exception as e:
+        logger.error(f"❌ Scraper supervision error: {e}")
+
+@tasks.loop(seconds=PRICE_REFRESH_SECONDS)
+async def refresh_prices():
+    """Keep the pre-rendered /price message and live ticker current"""
+    try:
+        await refresh_price_data()
+    except Exception as e:
+        logger.error(f"❌ Price refresh error: {e}")
+
+@tasks.loop(seconds=300)  # Report every 5 minutes
+async def report_rpc_usage():
+    """Log RPC budget usage per endpoint"""
+    try:
+        for url, scheduler in rpc_schedulers.items():
+            usage = scheduler.usage()
+            logger.info(
+                f"📡 RPC budget {url}: {usage['rate']:.2f}/{usage['max_rate']:.2f} req/s, "
+                f"{usage['tokens']:.1f}/{usage['burst']:.0f} tokens, {usage['weight_spent']} weight spent, "
+                f"{usage['rate_limited']} rate limited, {usage['wait_seconds']:.1f}s waited, "
+                f"requests {usage['requests']}"
+            )
+    except Exception as e:
+        logger.error(f"❌ RPC usage report error: {e}")
+
 @bot.event
 async def on_ready():
     """Bot ready event"""
@@ -677,16 +954,19 @@ async def on_ready():
     else:
         logger.error(f"❌ Price Feed Channel {PRICE_FEED_CHANNEL_ID} not found!")
     
-    # Test system setup
-    logger.info("🧪 Testing system setup...")
-    chrome_binary = find_chrome_binary()
-    if chrome_binary:
-        get_chrome_version(chrome_binary)
+    # Start scraper workers (each checks the Chrome setup on startup)
+    logger.info(f"🧰 Starting {SCRAPER_WORKERS} scraper workers...")
+    await scraper_pool.start()
+    if not supervise_scrapers.is_running():
+        supervise_scrapers.start()
+    if not report_rpc_usage.is_running():
+        report_rpc_usage.start()
+    if not refresh_prices.is_running():
+        refresh_prices.start()
     
     # Start monitoring tasks
     logger.info("🚀 Starting monitoring tasks...")
     monitor_transactions.start()
-    monitor_floor_price.start()
 
 @bot.event
 async def on_disconnect():
@@ -0,0 +1,413 @@
+# Selenium scraper worker - runs out of process, driven by main.py over stdin/stdout
+import os
+import sys
+import time
+import json
+import logging
+import subprocess
+import requests
+import zipfile
+import stat
+import shutil
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# Setup logging (stderr, shared with the bot's log output)
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("scraper_worker")
+
+def find_chrome_binary():
+    """Find Chrome/Chromium binary location - copied from your working code"""
+    railway_chrome = os.environ.get("GOOGLE_CHROME_BIN")
+    if railway_chrome and os.path.exists(railway_chrome):
+        logger.info(f"✅ Found Railway Chrome binary: {railway_chrome}")
+        return railway_chrome
+    
+    possible_paths = [
+        "/usr/bin/google-chrome",
+        "/usr/bin/google-chrome-stable",
+        "/usr/bin/chromium",
+        "/usr/bin/chromium-browser",
+        "/snap/bin/chromium",
+        "/usr/bin/chrome",
+        "/opt/google/chrome/google-chrome",
+        "/app/.chrome-for-testing/chrome-linux64/chrome"
+    ]
+    
+    for path in possible_paths:
+        if os.path.exists(path):
+            logger.info(f"✅ Found Chrome binary: {path}")
+            return path
+    
+    logger.error("❌ No Chrome binary found")
+    return None
+
+def get_chrome_version(chrome_path):
+    """Get Chrome version - copied from your working code"""
+    try:
+        result = subprocess.run([chrome_path, "--version"], 
+                              capture_output=True, text=True, timeout=10)
+        if result.returncode == 0:
+            version_output = result.stdout.strip()
+            logger.info(f"✅ Chrome version: {version_output}")
+            
+            version_parts = version_output.split()
+            version_number = version_parts[-1]
+            major_version = version_number.split('.')[0]
+            
+            logger.info(f"✅ Chrome major version: {major_version}")
+            return version_number, major_version
+        else:
+            logger.error(f"❌ Failed to get Chrome version: {result.stderr}")
+            return None, None
+    except Exception as e:
+        logger.error(f"❌ Error getting Chrome version: {e}")
+        return None, None
+
+def download_compatible_chromedriver(major_version):
+    """Download ChromeDriver - copied from your working code"""
+    try:
+        railway_chromedriver = os.environ.get("CHROMEDRIVER_PATH")
+        if railway_chromedriver and os.path.exists(railway_chromedriver):
+            logger.info(f"✅ Using Railway ChromeDriver: {railway_chromedriver}")
+            return railway_chromedriver
+        
+        driver_dir = "/tmp/chromedriver_new"
+        driver_path = os.path.join(driver_dir, "chromedriver")
+        
+        if os.path.exists(driver_dir):
+            shutil.rmtree(driver_dir)
+        
+        os.makedirs(driver_dir, exist_ok=True)
+        
+        logger.info(f"📥 Downloading ChromeDriver for Chrome {major_version}...")
+        
+        if int(major_version) >= 115:
+            try:
+                api_url = f"https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{major_version}"
+                logger.info(f"🔍 Checking API: {api_url}")
+                
+                response = requests.get(api_url, timeout=30)
+                if response.status_code == 200:
+                    driver_version = response.text.strip()
+                    logger.info(f"✅ Found ChromeDriver version: {driver_version}")
+                    download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
+                else:
+                    logger.warning(f"⚠️ API returned {response.status_code}, using fallback version")
+                    if major_version == "138":
+                        driver_version = "138.0.6906.100"
+                    else:
+                        driver_version = f"{major_version}.0.6000.0"
+                    download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
+                    
+            except Exception as e:
+                logger.warning(f"⚠️ New API failed: {e}, using fallback")
+                if major_version == "138":
+                    driver_version = "138.0.6906.100"
+                else:
+                    driver_version = f"{major_version}.0.6000.0"
+                download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/linux64/chromedriver-linux64.zip"
+        else:
+            api_url = f"https://chromedriver.storage.googleapis.com/LATEST_RELEASE_{major_version}"
+            try:
+                response = requests.get(api_url, timeout=30)
+                if response.status_code == 200:
+                    driver_version = response.text.strip()
+                    download_url = f"https://chromedriver.storage.googleapis.com/{driver_version}/chromedriver_linux64.zip"
+                else:
+                    raise Exception(f"Old API returned status {response.status_code}")
+            except Exception as e:
+                logger.error(f"❌ Failed to get ChromeDriver version for Chrome {major_version}: {e}")
+                return None
+        
+        logger.info(f"📥 Downloading ChromeDriver {driver_version} from: {download_url}")
+        
+        zip_path = os.path.join(driver_dir, "chromedriver.zip")
+        
+        try:
+            response = requests.get(download_url, timeout=120)
+            response.raise_for_status()
+            
+            with open(zip_path, 'wb') as f:
+                f.write(response.content)
+            
+            logger.info("📂 Extracting ChromeDriver...")
+            
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(driver_dir)
+            
+            chromedriver_found = False
+            for root, dirs, files in os.walk(driver_dir):
+                for file in files:
+                    if file == "chromedriver":
+                        extracted_path = os.path.join(root, file)
+                        if extracted_path != driver_path:
+                            shutil.move(extracted_path, driver_path)
+                        chromedriver_found = True
+                        break
+                if chromedriver_found:
+                    break
+            
+            if not chromedriver_found:
+                logger.error("❌ ChromeDriver executable not found in downloaded files")
+                return None
+            
+            os.chmod(driver_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+            os.remove(zip_path)
+            
+            logger.info("🧪 Testing downloaded ChromeDriver...")
+            result = subprocess.run([driver_path, "--version"], 
+                                  capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                logger.info(f"✅ ChromeDriver working: {result.stdout.strip()}")
+                return driver_path
+            else:
+                logger.error(f"❌ Downloaded ChromeDriver test failed: {result.stderr}")
+                return None
+                
+        except requests.RequestException as e:
+            logger.error(f"❌ Failed to download ChromeDriver: {e}")
+            return None
+            
+    except Exception as e:
+        logger.error(f"❌ ChromeDriver download error: {e}")
+        return None
+
+def setup_chromedriver_and_chrome():
+    """Setup ChromeDriver - copied from your working code"""
+    try:
+        chrome_binary = find_chrome_binary()
+        if not chrome_binary:
+            logger.error("❌ Chrome binary not found")
+            return None, None
+        
+        chrome_version, major_version = get_chrome_version(chrome_binary)
+        if not chrome_version or not major_version:
+            logger.error("❌ Could not determine Chrome version")
+            return None, None
+        
+        logger.info("📥 Downloading compatible ChromeDriver...")
+        chromedriver_path = download_compatible_chromedriver(major_version)
+        
+        if not chromedriver_path:
+            logger.error("❌ Could not download compatible ChromeDriver")
+            return None, None
+        
+        logger.info(f"✅ ChromeDriver setup complete: {chromedriver_path}")
+        return chromedriver_path, chrome_binary
+            
+    except Exception as e:
+        logger.error(f"❌ ChromeDriver setup error: {e}")
+        return None, None
+
+def create_chrome_options(chrome_binary):
+    """Create Chrome options - copied from your working code"""
+    options = Options()
+    
+    options.binary_location = chrome_binary
+    
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-plugins")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--remote-debugging-port=9222")
+    
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-software-rasterizer")
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-features=TranslateUI")
+    options.add_argument("--disable-features=VizDisplayCompositor")
+    options.add_argument("--disable-ipc-flooding-protection")
+    options.add_argument("--memory-pressure-off")
+    
+    options.add_argument("--max_old_space_size=4096")
+    options.add_argument("--disable-logging")
+    options.add_argument("--disable-dev-tools")
+    options.add_argument("--log-level=3")
+    options.add_argument("--silent")
+    
+    options.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    return options
+
+def wait_for_page_ready(driver, timeout=60):
+    """Wait for page ready - copied from your working code"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        
+        time.sleep(3)
+        
+        try:
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return typeof jQuery === 'undefined' || jQuery.active === 0")
+            )
+        except:
+            pass
+        
+        logger.info("✅ Page fully loaded")
+        return True
+        
+    except TimeoutException:
+        logger.warning("⚠️ Page load timeout, continuing anyway")
+        return False
+
+def fetch_nirvana_data(url, data_type):
+    """Fetch data from Nirvana Finance pages"""
+    driver = None
+    
+    try:
+        logger.info(f"🔄 Fetching {data_type} from {url}")
+        
+        chromedriver_path, chrome_binary = setup_chromedriver_and_chrome()
+        if not chromedriver_path or not chrome_binary:
+            logger.error("❌ Chrome/ChromeDriver setup failed")
+            return None
+        
+        options = create_chrome_options(chrome_binary)
+        service = Service(executable_path=chromedriver_path)
+        
+        logger.info("🚀 Starting Chrome WebDriver...")
+        driver = webdriver.Chrome(service=service, options=options)
+        
+        driver.set_page_load_timeout(120)
+        driver.implicitly_wait(10)
+        
+        logger.info(f"🌐 Loading {url}...")
+        driver.get(url)
+        
+        logger.info("⏳ Waiting for page to be fully loaded...")
+        wait_for_page_ready(driver, timeout=90)
+        
+        time.sleep(10)
+        
+        wait = WebDriverWait(driver, 60)
+        
+        selectors_to_try = [
+            ("CLASS_NAME", "DataPoint_dataPointValue__Bzf_E"),
+            ("CSS_SELECTOR", "[class*='DataPoint_dataPointValue']"),
+            ("CSS_SELECTOR", "[class*='dataPointValue']"),
+        ]
+        
+        data_text = None
+        
+        for selector_type, selector in selectors_to_try:
+            try:
+                logger.info(f"🔍 Trying {selector_type}: {selector}")
+                
+                if selector_type == "CLASS_NAME":
+                    elements = wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, selector)))
+                elif selector_type == "CSS_SELECTOR":
+                    elements = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
+                
+                # For mint page, get first element (ANA price)
+                # For realize page, we need to identify which element based on context
+                if "mint" in url:
+                    element = elements[0] if elements else None
+                elif "realize" in url:
+                    # Floor price is typically first, prANA might be second
+                    if data_type == "floor_price":
+                        element = elements[0] if elements else None
+                    elif data_type == "prana_price":
+                        element = elements[1] if len(elements) > 1 else None
+                    else:
+                        element = elements[0] if elements else None
+                else:
+                    element = elements[0] if elements else None
+                
+                if element:
+                    wait.until(EC.visibility_of(element))
+                    time.sleep(5)
+                    
+                    data_text = element.text.strip()
+                    logger.info(f"📝 Found {data_type}: '{data_text}'")
+                    
+                    if data_text and data_text != "":
+                        break
+                        
+            except TimeoutException:
+                logger.debug(f"⏳ {selector_type} '{selector}' timed out")
+                continue
+            except Exception as e:
+                logger.debug(f"⚠️ {selector_type} '{selector}' failed: {e}")
+                continue
+        
+        if data_text:
+            # Clean the data
+            cleaned_data = data_text.replace("USDC", "").replace("$", "").replace(",", "").strip()
+            
+            logger.info(f"🧹 Cleaned '{data_text}' to '{cleaned_data}'")
+            
+            if cleaned_data:
+                try:
+                    float(cleaned_data)
+                    logger.info(f"✅ Valid {data_type} extracted: {cleaned_data}")
+                    return cleaned_data
+                except ValueError:
+                    logger.warning(f"⚠️ Invalid number format: '{cleaned_data}'")
+                    return None
+            else:
+                logger.warning(f"⚠️ {data_type} text empty after cleaning")
+                return None
+        else:
+            logger.warning(f"⚠️ No {data_type} found")
+            return None
+            
+    except Exception as e:
+        logger.error(f"❌ Error fetching {data_type}: {e}")
+        return None
+        
+    finally:
+        if driver:
+            try:
+                driver.quit()
+                logger.info("🔄 Chrome WebDriver closed")
+            except Exception as close_error:
+                logger.warning(f"⚠️ Error closing WebDriver: {close_error}")
+
+def serve(requests_in, responses_out):
+    """Answer one JSON line per request until the bot closes the pipe"""
+    for line in requests_in:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            logger.warning(f"⚠️ Ignoring malformed request: {line!r}")
+            continue
+        
+        value = fetch_nirvana_data(request["url"], request["data_type"])
+        
+        responses_out.write(json.dumps({"id": request["id"], "value": value}) + "\n")
+        responses_out.flush()
+
+def main():
+    """Worker entry point"""
+    # Keep the protocol on a private copy of stdout and route everything else
+    # (Chrome, ChromeDriver, stray prints) to stderr
+    responses_out = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+    
+    logger.info(f"🧰 Scraper worker started (pid {os.getpid()})")
+    
+    chrome_binary = find_chrome_binary()
+    if chrome_binary:
+        get_chrome_version(chrome_binary)
+    
+    serve(sys.stdin, responses_out)
+    logger.info(f"👋 Scraper worker exiting (pid {os.getpid()})")
+
+if __name__ == "__main__":
+    main()